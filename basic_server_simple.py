@@ -1,213 +1,328 @@
 #!/usr/bin/env python3
 """Basic MCP Server - Simplified Version"""
 
+from __future__ import annotations
+
+import argparse
 import asyncio
 import json
 import logging
+import operator
 import sys
+import time
 from datetime import datetime
 from typing import Sequence
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Set up logging first
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for response payloads; fall back to the stdlib encoder
+if orjson is not None:
+    _dumps = lambda o: orjson.dumps(o, option=orjson.OPT_INDENT_2).decode()
+else:
+    _dumps = lambda o: json.dumps(o, indent=2)
+
+# Tool input schemas
+_CALCULATE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": ["add", "subtract", "multiply", "divide"],
+            "description": "The arithmetic operation to perform"
+        },
+        "a": {
+            "type": "number",
+            "description": "First number"
+        },
+        "b": {
+            "type": "number",
+            "description": "Second number"
+        }
+    },
+    "required": ["operation", "a", "b"]
+}
+
+_GREET_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "Name of the person to greet"
+        },
+        "style": {
+            "type": "string",
+            "enum": ["formal", "casual", "friendly"],
+            "description": "Style of greeting",
+            "default": "friendly"
+        }
+    },
+    "required": ["name"]
+}
+
+_SERVER_INFO_SCHEMA = {
+    "type": "object",
+    "properties": {},
+    "additionalProperties": False
+}
+
+# Static server info/status payloads are serialized once; only the
+# timestamp placeholder is substituted per request.
+_TIMESTAMP_PLACEHOLDER = '"__TS__"'
+
+_INFO_TEMPLATE = _dumps({
+    "server_name": "Basic MCP Server",
+    "description": "A simple example MCP server demonstrating basic functionality",
+    "version": "1.0.0",
+    "capabilities": ["tools", "resources"],
+    "tools_count": 3,
+    "resources_count": 2,
+    "uptime": "N/A",
+    "timestamp": "__TS__"
+})
+
+_STATUS_TEMPLATE = _dumps({
+    "server_name": "Basic MCP Server",
+    "status": "running",
+    "uptime": "N/A",
+    "version": "1.0.0",
+    "timestamp": "__TS__"
+})
+
+
+def _render_with_timestamp(template: str) -> str:
+    """Fill the timestamp placeholder of a pre-serialized payload."""
+    return template.replace(_TIMESTAMP_PLACEHOLDER, json.dumps(datetime.now().isoformat()))
+
+
+# Last rendered time resource, reused while the wall-clock second is unchanged
+_last_ts_sec = None
+_last_ts_text = ""
+
+
+def _current_time_text() -> str:
+    """Render the time://current resource, reformatting at most once per second."""
+    global _last_ts_sec, _last_ts_text
+
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        current_time = datetime.fromtimestamp(sec).isoformat(" ", "seconds")
+        _last_ts_text = f"Current server time: {current_time}"
+        _last_ts_sec = sec
+    return _last_ts_text
+
+
+# Arithmetic operations supported by the calculate tool
+_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
+
+def _do_calc(arguments: dict) -> str:
+    """Perform a basic arithmetic calculation."""
+    operation = arguments.get("operation")
+    a = float(arguments.get("a"))
+    b = float(arguments.get("b"))
+
+    op = _OPS.get(operation)
+    if op is None:
+        raise ValueError(f"Unknown operation: {operation}")
+    if op is operator.truediv and b == 0:
+        raise ValueError("Division by zero is not allowed")
+
+    return f"Result: {a} {operation} {b} = {op(a, b)}"
+
+
+# Greeting style -> (prefix, suffix) around the name
+_GREETINGS = {
+    "formal": ("Good day, ", ". I hope you are well."),
+    "casual": ("Hey ", "! What's up?"),
+    "friendly": ("Hello ", "! Nice to meet you!"),
+}
+
+
+def _do_greet(arguments: dict) -> str:
+    """Generate a personalized greeting."""
+    name_arg = arguments.get("name", "").strip()
+    if not name_arg:
+        raise ValueError("Name is required for greeting")
+
+    # Unknown styles fall back to friendly
+    prefix, suffix = _GREETINGS.get(arguments.get("style"), _GREETINGS["friendly"])
+    return prefix + name_arg + suffix
+
+
+def _do_server_info(arguments: dict) -> str:
+    """Get information about the server."""
+    return _render_with_timestamp(_INFO_TEMPLATE)
+
+
+# Tool name -> handler returning the response text
+_TOOL_HANDLERS = {
+    "calculate": _do_calc,
+    "greet": _do_greet,
+    "get_server_info": _do_server_info,
+}
+
+
+# MCP SDK names, bound by _load_mcp() so import errors surface in main()
+Server = stdio_server = TextContent = Tool = Resource = None
+
+# Static listings, built once by _load_mcp()
+_TOOLS: tuple = ()
+_RESOURCES: tuple = ()
+
+
+def _load_mcp() -> None:
+    """Import the MCP SDK and build the static tool/resource listings.
+
+    Safe to call repeatedly; only the first call does any work.
+    """
+    global Server, stdio_server, TextContent, Tool, Resource
+    global _TOOLS, _RESOURCES
+
+    if _TOOLS:
+        return
+
+    from mcp.server import Server
+    from mcp.server.stdio import stdio_server
+    from mcp.types import TextContent, Tool, Resource
+
+    _TOOLS = (
+        Tool(
+            name="calculate",
+            description="Perform basic arithmetic calculations",
+            inputSchema=_CALCULATE_SCHEMA
+        ),
+        Tool(
+            name="greet",
+            description="Generate a personalized greeting",
+            inputSchema=_GREET_SCHEMA
+        ),
+        Tool(
+            name="get_server_info",
+            description="Get information about the server",
+            inputSchema=_SERVER_INFO_SCHEMA
+        )
+    )
+    _RESOURCES = (
+        Resource(
+            uri="time://current",
+            name="Current Time",
+            description="Current server time",
+            mimeType="text/plain"
+        ),
+        Resource(
+            uri="server://status",
+            name="Server Status",
+            description="Current server status and information",
+            mimeType="application/json"
+        )
+    )
+
+
+async def _list_tools() -> list[Tool]:
+    """List available tools."""
+    _load_mcp()
+    return list(_TOOLS)
+
+
+async def _call_tool(name: str, arguments: dict) -> Sequence[TextContent]:
+    """Handle tool calls."""
+    _load_mcp()
+    try:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return [TextContent(type="text", text=handler(arguments))]
+    except Exception as e:
+        logger.error("Error in tool %s: %s", name, e)
+        return [TextContent(type="text", text=f"Error: {str(e)}")]
+
+
+async def _list_resources() -> list[Resource]:
+    """List available resources."""
+    _load_mcp()
+    return list(_RESOURCES)
+
+
+async def _read_resource(uri: str) -> str:
+    """Read a resource by URI."""
+    if uri == "time://current":
+        return _current_time_text()
+    elif uri == "server://status":
+        return _render_with_timestamp(_STATUS_TEMPLATE)
+    else:
+        raise ValueError(f"Unknown resource: {uri}")
+
+
+async def serve():
+    """Main server function."""
+    _load_mcp()
+    server = Server("basic-mcp-server")
+
+    server.list_tools()(_list_tools)
+    server.call_tool()(_call_tool)
+    server.list_resources()(_list_resources)
+    server.read_resource()(_read_resource)
+
+    # Start the server
+    options = server.create_initialization_options()
+    async with stdio_server() as (read_stream, write_stream):
+        # Server.run (mcp 1.0) awaits each request inline rather than spawning a
+        # task per message, and the stdio transport streams have zero buffer, so
+        # in-flight work is already bounded to one message without a worker pool.
+        await server.run(read_stream, write_stream, options)
+
+
+_parser = argparse.ArgumentParser(description="Basic MCP Server")
+_parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+
+
+def _run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 def main():
     """Entry point for the server."""
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Basic MCP Server")
-    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
-    
-    args = parser.parse_args()
+    # Parse arguments before touching MCP so --help never imports the SDK
+    args = _parser.parse_args()
     
     if args.debug:
         logging.getLogger().setLevel(logging.DEBUG)
     
     try:
         # Import MCP components here to handle import errors better
-        from mcp.server import Server
-        from mcp.server.stdio import stdio_server
-        from mcp.types import TextContent, Tool, Resource
-        
-        async def serve():
-            """Main server function."""
-            server = Server("basic-mcp-server")
-
-            @server.list_tools()
-            async def list_tools() -> list[Tool]:
-                """List available tools."""
-                return [
-                    Tool(
-                        name="calculate",
-                        description="Perform basic arithmetic calculations",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "operation": {
-                                    "type": "string",
-                                    "enum": ["add", "subtract", "multiply", "divide"],
-                                    "description": "The arithmetic operation to perform"
-                                },
-                                "a": {
-                                    "type": "number",
-                                    "description": "First number"
-                                },
-                                "b": {
-                                    "type": "number",
-                                    "description": "Second number"
-                                }
-                            },
-                            "required": ["operation", "a", "b"]
-                        }
-                    ),
-                    Tool(
-                        name="greet",
-                        description="Generate a personalized greeting",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {
-                                "name": {
-                                    "type": "string",
-                                    "description": "Name of the person to greet"
-                                },
-                                "style": {
-                                    "type": "string",
-                                    "enum": ["formal", "casual", "friendly"],
-                                    "description": "Style of greeting",
-                                    "default": "friendly"
-                                }
-                            },
-                            "required": ["name"]
-                        }
-                    ),
-                    Tool(
-                        name="get_server_info",
-                        description="Get information about the server",
-                        inputSchema={
-                            "type": "object",
-                            "properties": {},
-                            "additionalProperties": False
-                        }
-                    )
-                ]
-
-            @server.call_tool()
-            async def call_tool(name: str, arguments: dict) -> Sequence[TextContent]:
-                """Handle tool calls."""
-                try:
-                    if name == "calculate":
-                        operation = arguments.get("operation")
-                        a = float(arguments.get("a"))
-                        b = float(arguments.get("b"))
-
-                        if operation == "add":
-                            result = a + b
-                        elif operation == "subtract":
-                            result = a - b
-                        elif operation == "multiply":
-                            result = a * b
-                        elif operation == "divide":
-                            if b == 0:
-                                raise ValueError("Division by zero is not allowed")
-                            result = a / b
-                        else:
-                            raise ValueError(f"Unknown operation: {operation}")
-
-                        return [TextContent(
-                            type="text",
-                            text=f"Result: {a} {operation} {b} = {result}"
-                        )]
-                        
-                    elif name == "greet":
-                        name_arg = arguments.get("name", "").strip()
-                        if not name_arg:
-                            raise ValueError("Name is required for greeting")
-
-                        style = arguments.get("style", "friendly")
-                        
-                        if style == "formal":
-                            greeting = f"Good day, {name_arg}. I hope you are well."
-                        elif style == "casual":
-                            greeting = f"Hey {name_arg}! What's up?"
-                        else:  # friendly
-                            greeting = f"Hello {name_arg}! Nice to meet you!"
-
-                        return [TextContent(type="text", text=greeting)]
-                        
-                    elif name == "get_server_info":
-                        info = {
-                            "server_name": "Basic MCP Server",
-                            "description": "A simple example MCP server demonstrating basic functionality",
-                            "version": "1.0.0",
-                            "capabilities": ["tools", "resources"],
-                            "tools_count": 3,
-                            "resources_count": 2,
-                            "uptime": "N/A",
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        
-                        return [TextContent(
-                            type="text",
-                            text=json.dumps(info, indent=2)
-                        )]
-                    else:
-                        raise ValueError(f"Unknown tool: {name}")
-                except Exception as e:
-                    logger.error(f"Error in tool {name}: {e}")
-                    return [TextContent(type="text", text=f"Error: {str(e)}")]
-
-            @server.list_resources()
-            async def list_resources() -> list[Resource]:
-                """List available resources."""
-                return [
-                    Resource(
-                        uri="time://current",
-                        name="Current Time",
-                        description="Current server time",
-                        mimeType="text/plain"
-                    ),
-                    Resource(
-                        uri="server://status",
-                        name="Server Status",
-                        description="Current server status and information",
-                        mimeType="application/json"
-                    )
-                ]
-
-            @server.read_resource()
-            async def read_resource(uri: str) -> str:
-                """Read a resource by URI."""
-                if uri == "time://current":
-                    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    return f"Current server time: {current_time}"
-                elif uri == "server://status":
-                    status = {
-                        "server_name": "Basic MCP Server",
-                        "status": "running",
-                        "uptime": "N/A",
-                        "version": "1.0.0",
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    return json.dumps(status, indent=2)
-                else:
-                    raise ValueError(f"Unknown resource: {uri}")
-
-            # Start the server
-            options = server.create_initialization_options()
-            async with stdio_server() as (read_stream, write_stream):
-                await server.run(read_stream, write_stream, options)
-        
-        asyncio.run(serve())
+        _load_mcp()
+        _run(serve())
         
     except ImportError as e:
-        logger.error(f"MCP import error: {e}")
+        logger.error("MCP import error: %s", e)
         logger.error("Make sure the MCP SDK is installed: pip install mcp")
         sys.exit(1)
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
 
 
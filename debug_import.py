@@ -10,12 +10,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 try:
     import basic_server
     print("Module imported successfully")
+    # The package object *is* its __init__ module, so this lists the init contents too
     print("Available attributes:", [attr for attr in dir(basic_server) if not attr.startswith('_')])
     
-    # Try to access the actual module content
-    import basic_server.__init__ as init_module
-    print("Init module attributes:", [attr for attr in dir(init_module) if not attr.startswith('_')])
-    
 except Exception as e:
     print(f"Import error: {e}")
     import traceback
@@ -12,14 +12,18 @@ This is useful for:
 """
 
 import asyncio
+import io
 import json
 import logging
+from contextlib import AsyncExitStack
+from functools import partial
 from typing import Any, Dict, List, Optional
 
 # Note: These imports may need to be adjusted based on the MCP SDK version
 try:
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.stdio import stdio_client
+    from mcp.types import Resource, Tool
     MCP_AVAILABLE = True
 except ImportError:
     print("MCP SDK not available. Install with: pip install mcp")
@@ -29,11 +33,23 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _join_text(contents) -> str:
+    """Join the text parts of a response, skipping non-text content"""
+    # Most responses carry exactly one text block
+    if len(contents) == 1 and hasattr(contents[0], 'text'):
+        return contents[0].text
+    return '\n'.join(content.text for content in contents if hasattr(content, 'text'))
+
+
 class MCPClientExample:
     """Example MCP client for interacting with servers"""
     
+    __slots__ = ("session", "_stack")
+    
     def __init__(self):
         self.session: Optional[ClientSession] = None
+        # Owns the stdio transport and session so disconnect() can close both
+        self._stack = AsyncExitStack()
     
     async def connect_to_server(self, command: str, args: List[str], cwd: Optional[str] = None):
         """Connect to an MCP server via stdio"""
@@ -50,22 +66,25 @@ class MCPClientExample:
         )
         
         # Connect to the server
-        stdio_transport = stdio_client(server_params)
-        read_stream, write_stream = await stdio_transport.__aenter__()
+        read_stream, write_stream = await self._stack.enter_async_context(
+            stdio_client(server_params)
+        )
         
         # Create client session
-        self.session = ClientSession(read_stream, write_stream)
+        self.session = await self._stack.enter_async_context(
+            ClientSession(read_stream, write_stream)
+        )
         await self.session.initialize()
         
         logger.info("Connected to MCP server successfully")
     
-    async def list_tools(self) -> List[Dict[str, Any]]:
+    async def list_tools(self) -> List["Tool"]:
         """List available tools from the server"""
         if not self.session:
             raise RuntimeError("Not connected to a server")
         
         response = await self.session.list_tools()
-        return [tool.dict() for tool in response.tools]
+        return response.tools
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> str:
         """Call a tool on the server"""
@@ -77,20 +96,15 @@ class MCPClientExample:
         response = await self.session.call_tool(name, arguments)
         
         # Extract text content from response
-        content_parts = []
-        for content in response.content:
-            if hasattr(content, 'text'):
-                content_parts.append(content.text)
-        
-        return '\n'.join(content_parts)
+        return _join_text(response.content)
     
-    async def list_resources(self) -> List[Dict[str, Any]]:
+    async def list_resources(self) -> List["Resource"]:
         """List available resources from the server"""
         if not self.session:
             raise RuntimeError("Not connected to a server")
         
         response = await self.session.list_resources()
-        return [resource.dict() for resource in response.resources]
+        return response.resources
     
     async def get_resource(self, uri: str) -> str:
         """Get a resource from the server"""
@@ -102,26 +116,22 @@ class MCPClientExample:
         response = await self.session.get_resource(uri)
         
         # Extract text content from response
-        content_parts = []
-        for content in response.contents:
-            if hasattr(content, 'text'):
-                content_parts.append(content.text)
-        
-        return '\n'.join(content_parts)
+        return _join_text(response.contents)
     
     async def disconnect(self):
         """Disconnect from the server"""
+        # Closes the session, then the transport and its server subprocess
+        await self._stack.aclose()
         if self.session:
-            await self.session.close()
             self.session = None
             logger.info("Disconnected from MCP server")
 
 
-async def demo_basic_server():
+async def demo_basic_server(write=print):
     """Demonstrate interaction with the basic server"""
-    print("\n" + "="*50)
-    print("Basic Server Demo")
-    print("="*50)
+    write("\n" + "="*50)
+    write("Basic Server Demo")
+    write("="*50)
     
     client = MCPClientExample()
     
@@ -130,50 +140,50 @@ async def demo_basic_server():
         await client.connect_to_server("python", ["-m", "src.basic_server"])
         
         # List available tools
-        print("\n📋 Available Tools:")
+        write("\n📋 Available Tools:")
         tools = await client.list_tools()
         for tool in tools:
-            print(f"  • {tool['name']}: {tool['description']}")
+            write(f"  • {tool.name}: {tool.description}")
         
         # Test calculator tool
-        print("\n🧮 Testing Calculator:")
+        write("\n🧮 Testing Calculator:")
         result = await client.call_tool("calculate", {
             "operation": "add",
             "a": 15,
             "b": 27
         })
-        print(f"Result: {result}")
+        write(f"Result: {result}")
         
         # Test greeting tool
-        print("\n👋 Testing Greeting:")
+        write("\n👋 Testing Greeting:")
         result = await client.call_tool("greet", {
             "name": "Alice",
             "style": "enthusiastic"
         })
-        print(f"Result: {result}")
+        write(f"Result: {result}")
         
         # List and get resources
-        print("\n📚 Available Resources:")
+        write("\n📚 Available Resources:")
         resources = await client.list_resources()
         for resource in resources:
-            print(f"  • {resource['name']}: {resource['description']}")
+            write(f"  • {resource.name}: {resource.description}")
         
         # Get current time resource
-        print("\n🕐 Current Time:")
+        write("\n🕐 Current Time:")
         time_resource = await client.get_resource("time://current")
-        print(f"Result: {time_resource}")
+        write(f"Result: {time_resource}")
         
     except Exception as e:
-        print(f"Error: {e}")
+        write(f"Error: {e}")
     finally:
         await client.disconnect()
 
 
-async def demo_task_manager():
+async def demo_task_manager(write=print):
     """Demonstrate interaction with the task manager"""
-    print("\n" + "="*50)
-    print("Task Manager Demo")
-    print("="*50)
+    write("\n" + "="*50)
+    write("Task Manager Demo")
+    write("="*50)
     
     client = MCPClientExample()
     
@@ -182,7 +192,7 @@ async def demo_task_manager():
         await client.connect_to_server("python", ["-m", "src.task_manager"])
         
         # Create a task
-        print("\n➕ Creating a new task:")
+        write("\n➕ Creating a new task:")
         result = await client.call_tool("create_task", {
             "title": "Learn MCP Protocol",
             "description": "Study the Model Context Protocol documentation and examples",
@@ -190,29 +200,29 @@ async def demo_task_manager():
             "priority": "high",
             "due_date": "2024-12-31"
         })
-        print(f"Result: {result}")
+        write(f"Result: {result}")
         
         # List all tasks
-        print("\n📋 Listing all tasks:")
+        write("\n📋 Listing all tasks:")
         result = await client.call_tool("list_tasks", {})
-        print(f"Result: {result}")
+        write(f"Result: {result}")
         
         # Get task statistics
-        print("\n📊 Task Statistics:")
+        write("\n📊 Task Statistics:")
         result = await client.call_tool("get_task_stats", {})
-        print(f"Result: {result}")
+        write(f"Result: {result}")
         
     except Exception as e:
-        print(f"Error: {e}")
+        write(f"Error: {e}")
     finally:
         await client.disconnect()
 
 
-async def demo_weather_service():
+async def demo_weather_service(write=print):
     """Demonstrate interaction with the weather service"""
-    print("\n" + "="*50)
-    print("Weather Service Demo")
-    print("="*50)
+    write("\n" + "="*50)
+    write("Weather Service Demo")
+    write("="*50)
     
     client = MCPClientExample()
     
@@ -221,29 +231,29 @@ async def demo_weather_service():
         await client.connect_to_server("python", ["-m", "src.weather_service"])
         
         # Get current weather
-        print("\n🌤️ Getting weather for London:")
+        write("\n🌤️ Getting weather for London:")
         result = await client.call_tool("get_current_weather", {
             "location": "London,UK",
             "units": "metric"
         })
-        print(f"Result: {result}")
+        write(f"Result: {result}")
         
         # Get weather by coordinates (New York City)
-        print("\n🗽 Getting weather by coordinates (NYC):")
+        write("\n🗽 Getting weather by coordinates (NYC):")
         result = await client.call_tool("get_weather_by_coordinates", {
             "latitude": 40.7128,
             "longitude": -74.0060,
             "units": "imperial"
         })
-        print(f"Result: {result}")
+        write(f"Result: {result}")
         
         # Get API information
-        print("\n📡 Weather API Info:")
+        write("\n📡 Weather API Info:")
         api_info = await client.get_resource("weather://api-info")
-        print(f"Result: {api_info}")
+        write(f"Result: {api_info}")
         
     except Exception as e:
-        print(f"Error: {e}")
+        write(f"Error: {e}")
     finally:
         await client.disconnect()
 
@@ -277,13 +287,19 @@ async def interactive_demo():
 
 
 async def run_all_demos():
-    """Run all demos in sequence"""
+    """Run all demos concurrently"""
     print("🚀 Running All MCP Server Demos")
     print("="*60)
     
-    await demo_basic_server()
-    await demo_task_manager()
-    await demo_weather_service()
+    # Each demo owns its own client and server process, so they can overlap;
+    # their output is buffered and printed in order once all have finished
+    demos = (demo_basic_server, demo_task_manager, demo_weather_service)
+    outputs = [io.StringIO() for _ in demos]
+    await asyncio.gather(*(
+        demo(partial(print, file=out)) for demo, out in zip(demos, outputs)
+    ))
+    for out in outputs:
+        print(out.getvalue(), end="")
     
     print("\n" + "="*60)
     print("✅ All demos completed!")
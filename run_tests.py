@@ -6,66 +6,113 @@ import json
 import subprocess
 import sys
 import os
+import threading
+from functools import partial
 from pathlib import Path
 
-def test_basic_server():
+BASIC_SERVER = "basic_server_simple.py"
+TASK_MANAGER = "src/task_manager/__init__.py"
+
+def start_help(server_path):
+    """Launch ``server_path --help`` in the background and return the process."""
+    return subprocess.Popen(
+        [sys.executable, server_path, "--help"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+def scan_help(proc, marker, timeout=5):
+    """Stream a --help process's stdout, stopping at the first line with ``marker``.
+    
+    Returns ``(found, stderr)``; a watchdog kills the process after ``timeout``
+    seconds.
+    """
+    watchdog = threading.Timer(timeout, proc.kill)
+    watchdog.start()
+    try:
+        for line in proc.stdout:
+            if marker in line:
+                proc.terminate()
+                return True, ""
+        return False, proc.stderr.read()
+    finally:
+        watchdog.cancel()
+        proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+def test_basic_server(proc=None):
     """Test the basic server functionality."""
     print("🧪 Testing Basic Server...")
     
-    server_path = Path("basic_server_simple.py")
-    if not server_path.exists():
+    server_path = BASIC_SERVER
+    if not os.path.exists(server_path):
         print("❌ Basic server file not found")
         return False
     
     try:
         # Test help command
-        result = subprocess.run(
-            [sys.executable, str(server_path), "--help"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        found, stderr = scan_help(proc or start_help(server_path), "Basic MCP Server")
         
-        if result.returncode == 0 and "Basic MCP Server" in result.stdout:
+        if found:
             print("✅ Basic server help command works")
             return True
         else:
-            print(f"❌ Basic server help failed: {result.stderr}")
+            print(f"❌ Basic server help failed: {stderr}")
             return False
             
     except Exception as e:
         print(f"❌ Basic server test error: {e}")
         return False
 
-def test_task_manager():
+def test_task_manager(proc=None):
     """Test the task manager server."""
     print("🧪 Testing Task Manager Server...")
     
-    server_path = Path("src/task_manager/__init__.py")
-    if not server_path.exists():
+    server_path = TASK_MANAGER
+    if not os.path.exists(server_path):
         print("❌ Task manager server file not found")
         return False
     
     try:
         # Test help command  
-        result = subprocess.run(
-            [sys.executable, str(server_path), "--help"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        found, stderr = scan_help(proc or start_help(server_path), "Task Manager MCP Server")
         
-        if result.returncode == 0 and "Task Manager MCP Server" in result.stdout:
+        if found:
             print("✅ Task manager help command works")
             return True
         else:
-            print(f"❌ Task manager help failed: {result.stderr}")
+            print(f"❌ Task manager help failed: {stderr}")
             return False
             
     except Exception as e:
         print(f"❌ Task manager test error: {e}")
         return False
 
+def existing_paths(paths):
+    """Return the subset of ``paths`` that exist, listing each directory once."""
+    listings = {}
+    found = set()
+    for path in paths:
+        dirname, basename = os.path.split(path)
+        if dirname not in listings:
+            try:
+                with os.scandir(dirname or ".") as entries:
+                    listings[dirname] = {entry.name for entry in entries}
+            except OSError:
+                listings[dirname] = None
+        
+        present = listings[dirname]
+        if present is None:
+            exists = os.path.exists(path)
+        else:
+            exists = basename in present
+        if exists:
+            found.add(path)
+    
+    return found
+
 def check_documentation():
     """Check if documentation files exist."""
     print("📚 Checking Documentation...")
@@ -78,9 +125,10 @@ def check_documentation():
         "requirements.txt"
     ]
     
+    present = existing_paths(docs)
     all_exist = True
     for doc in docs:
-        if Path(doc).exists():
+        if doc in present:
             print(f"✅ {doc}")
         else:
             print(f"❌ {doc} missing")
@@ -98,9 +146,10 @@ def check_examples():
         "examples/configurations/README.md"
     ]
     
+    present = existing_paths(examples)
     all_exist = True
     for example in examples:
-        if Path(example).exists():
+        if example in present:
             print(f"✅ {example}")
         else:
             print(f"❌ {example} missing")
@@ -115,11 +164,17 @@ def main():
     
     os.chdir(Path(__file__).parent)
     
+    # Start the server --help subprocesses up front so they run concurrently
+    help_procs = {
+        path: start_help(path) for path in (BASIC_SERVER, TASK_MANAGER)
+        if os.path.exists(path)
+    }
+    
     tests = [
         ("Documentation", check_documentation),
         ("Examples", check_examples), 
-        ("Basic Server", test_basic_server),
-        ("Task Manager", test_task_manager)
+        ("Basic Server", partial(test_basic_server, help_procs.get(BASIC_SERVER))),
+        ("Task Manager", partial(test_task_manager, help_procs.get(TASK_MANAGER)))
     ]
     
     results = {}
@@ -18,15 +18,23 @@ Security Features:
 """
 
 import asyncio
+import codecs
 import json
 import logging
 import mimetypes
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 import hashlib
+import io
+import re
 import stat
 
 from mcp.server import NotificationOptions, Server
@@ -48,13 +56,33 @@ logger = logging.getLogger(__name__)
 
 # Security configuration
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB limit
-ALLOWED_EXTENSIONS = {
+MAX_SEARCH_RESULTS = 500  # Default cap on matches returned by search_files
+HASH_CHUNK_SIZE = 1024 * 1024  # Bytes fed to each hasher per update
+CONTENT_CHUNK_SIZE = 64 * 1024  # Bytes lowercased per step of a content search
+DECODE_CHUNK_SIZE = 1024 * 1024  # Bytes decoded per step when reading text
+ALLOWED_EXTENSIONS = frozenset({
     '.txt', '.md', '.json', '.yaml', '.yml', '.csv', '.log', 
     '.py', '.js', '.html', '.css', '.xml', '.ini', '.cfg'
-}
-DANGEROUS_EXTENSIONS = {
+})
+DANGEROUS_EXTENSIONS = frozenset({
     '.exe', '.bat', '.cmd', '.sh', '.ps1', '.dll', '.so'
-}
+})
+
+# Extension -> MIME type, built once instead of calling guess_type per entry
+mimetypes.init()
+EXT2MIME = {ext.lower(): mime_type for ext, mime_type in mimetypes.types_map.items()}
+
+# Response formatting
+ICON_FILE = "📄"
+ICON_DIR = "📁"
+LIST_HEADER_TMPL = (
+    "📁 Directory: {directory}\n"
+    "📊 Total items: {total_items} ({files} files, {directories} directories)\n"
+)
+
+# Directory listing cache
+LISTING_CACHE_TTL = 5.0  # Seconds a listing may be reused
+LISTING_CACHE_MAX = 128  # Listings kept before the oldest is dropped
 
 # Default allowed directories (can be configured)
 DEFAULT_ALLOWED_DIRS = {
@@ -62,10 +90,129 @@ DEFAULT_ALLOWED_DIRS = {
     str(Path.cwd()),
 }
 
+# One worker per digest computed by get_file_hash
+_hash_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="file-hash")
+
 # MCP Server
 server = Server("file-operations-mcp-server")
 
 
+def _hash_file(f, hashers, parallel: bool = False) -> int:
+    """Feed an open binary file to every hasher through one reused buffer; returns bytes read"""
+    buf = bytearray(HASH_CHUNK_SIZE)
+    total = 0
+    with memoryview(buf) as view:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                return total
+            total += n
+            with view[:n] as chunk:
+                if parallel:
+                    # hashlib releases the GIL on large updates, so the
+                    # digests of each chunk can run side by side on separate cores
+                    futures = [_hash_executor.submit(hasher.update, chunk) for hasher in hashers]
+                    for future in futures:
+                        future.result()
+                else:
+                    for hasher in hashers:
+                        hasher.update(chunk)
+
+
+def _walk_entries(root, follow_symlinks: bool = False, allow_dir=None):
+    """Yield every DirEntry below root (str or bytes)
+    
+    Directory symlinks are only descended with follow_symlinks, and then only
+    when allow_dir(path) accepts them; each real directory is walked once.
+    """
+    stack = [root]
+    visited = set()
+    if follow_symlinks:
+        root_stat = os.stat(root)
+        visited.add((root_stat.st_dev, root_stat.st_ino))
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    yield entry
+                    if entry.is_dir(follow_symlinks=False):
+                        if follow_symlinks:
+                            # Remember plain directories too, so links back to them are skipped
+                            dir_stat = entry.stat(follow_symlinks=False)
+                            dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+                            if dir_key in visited:
+                                continue
+                            visited.add(dir_key)
+                        stack.append(entry.path)
+                    elif follow_symlinks and entry.is_symlink() and entry.is_dir():
+                        # Prune whole branches outside the sandbox before descending
+                        if allow_dir is not None and not allow_dir(entry.path):
+                            continue
+                        dir_stat = entry.stat()
+                        dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+                        if dir_key in visited:
+                            continue
+                        visited.add(dir_key)
+                        stack.append(entry.path)
+        except OSError:
+            continue  # Unreadable directory
+
+
+def _entry_stat(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """Return a scandir entry's (cached) stat, or None so _get_file_info reports the error"""
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+def _decode_text(chunks) -> Optional[str]:
+    """Decode UTF-8 byte chunks with universal newlines, or None if they are not valid UTF-8"""
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+    parts = []
+    try:
+        for chunk in chunks:
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b'', final=True))
+    except UnicodeDecodeError:
+        return None
+    return ''.join(parts)
+
+
+def _find_lowered(buf, pattern: bytes, start: int = 0) -> int:
+    """Find a lowercase ASCII pattern in buf case-insensitively, one chunk at a time"""
+    overlap = max(len(pattern) - 1, 0)
+    size = len(buf)
+    while start < size:
+        end = start + CONTENT_CHUNK_SIZE
+        hit = buf[start:end + overlap].lower().find(pattern)
+        if hit != -1:
+            return start + hit
+        start = end
+    return -1
+
+
+def _file_contains_lowered(f, pattern: bytes) -> bool:
+    """Check an open binary file for a lowercase ASCII pattern case-insensitively
+    
+    Reads through one reused buffer, carrying the last len(pattern) - 1 bytes
+    over so matches spanning two reads are found.
+    """
+    overlap = max(len(pattern) - 1, 0)
+    buf = bytearray(CONTENT_CHUNK_SIZE + overlap)
+    kept = 0
+    with memoryview(buf) as view:
+        while True:
+            n = f.readinto(view[kept:])
+            if not n:
+                return False
+            end = kept + n
+            if buf[:end].lower().find(pattern) != -1:
+                return True
+            kept = min(overlap, end)
+            buf[:kept] = buf[end - kept:end]
+
+
 class SecureFileManager:
     """Secure file operations manager with sandboxing"""
     
@@ -73,19 +220,52 @@ class SecureFileManager:
         self.allowed_dirs = set(allowed_dirs) if allowed_dirs else DEFAULT_ALLOWED_DIRS
         # Resolve and normalize paths
         self.allowed_dirs = {str(Path(d).resolve()) for d in self.allowed_dirs}
+        # (directory, directory + separator) pairs for cheap prefix checks
+        self._allowed_prefixes = tuple(
+            (d, d.rstrip(os.sep) + os.sep) for d in self.allowed_dirs
+        )
+        # (directory, include_hidden) -> (cached_at, dir mtime_ns, listing)
+        self._listing_cache: Dict[Tuple[str, bool], Tuple[float, int, Dict[str, Any]]] = {}
+        self._listing_lock = threading.Lock()
+        # Blocking file I/O runs here, one coarse task per operation
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="file-ops")
         logger.info(f"Initialized with allowed directories: {self.allowed_dirs}")
     
+    async def _run_blocking(self, func, *args):
+        """Run a blocking file operation on the worker pool, keeping the event loop free"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
     def _is_path_allowed(self, file_path: Path) -> bool:
-        """Check if the file path is within allowed directories"""
+        """Check if the file path is lexically within allowed directories (no syscalls)"""
         try:
-            resolved_path = file_path.resolve()
-            for allowed_dir in self.allowed_dirs:
-                if str(resolved_path).startswith(allowed_dir):
-                    return True
+            abs_path = os.path.abspath(os.fsdecode(file_path))
+        except (TypeError, ValueError):
             return False
-        except Exception:
+        # Compare whole components, so /foo/barn does not match /foo/bar
+        return any(
+            abs_path == allowed or abs_path.startswith(prefix)
+            for allowed, prefix in self._allowed_prefixes
+        )
+    
+    def _is_real_path_allowed(self, file_path: Path) -> bool:
+        """Check if the file path is within allowed directories after resolving symlinks"""
+        try:
+            return self._is_path_allowed(os.path.realpath(file_path))
+        except (OSError, ValueError):
             return False
     
+    def _invalidate_listings(self, file_path: Path) -> None:
+        """Drop cached listings of a written file's parent directory and its ancestors"""
+        parent = os.path.abspath(file_path.parent)
+        with self._listing_lock:
+            stale = [
+                key for key in self._listing_cache
+                if parent == key[0] or parent.startswith(key[0].rstrip(os.sep) + os.sep)
+            ]
+            for key in stale:
+                del self._listing_cache[key]
+    
     def _is_extension_allowed(self, file_path: Path) -> bool:
         """Check if file extension is allowed"""
         extension = file_path.suffix.lower()
@@ -96,31 +276,44 @@ class SecureFileManager:
             return False
         return True
     
-    def _get_file_info(self, file_path: Path) -> Dict[str, Any]:
-        """Get file metadata"""
+    def _get_file_info(self, file_path: Path, stat_info: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Get file metadata from a single stat call (or a precomputed stat result)"""
         try:
-            stat_info = file_path.stat()
+            if stat_info is None:
+                stat_info = os.stat(file_path)
+            mode = stat_info.st_mode
+            extension = file_path.suffix.lower()
+            modified = datetime.fromtimestamp(stat_info.st_mtime).isoformat()
+            # Untouched files share both timestamps; format it only once
+            if stat_info.st_ctime == stat_info.st_mtime:
+                created = modified
+            else:
+                created = datetime.fromtimestamp(stat_info.st_ctime).isoformat()
             return {
                 "name": file_path.name,
                 "path": str(file_path),
                 "size": stat_info.st_size,
-                "modified": datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                "created": datetime.fromtimestamp(stat_info.st_ctime).isoformat(),
-                "is_file": file_path.is_file(),
-                "is_dir": file_path.is_dir(),
+                "modified": modified,
+                "created": created,
+                "is_file": stat.S_ISREG(mode),
+                "is_dir": stat.S_ISDIR(mode),
                 "permissions": oct(stat_info.st_mode)[-3:],
-                "mime_type": mimetypes.guess_type(str(file_path))[0],
-                "extension": file_path.suffix.lower()
+                "mime_type": EXT2MIME.get(extension),
+                "extension": extension
             }
         except Exception as e:
             return {"error": f"Cannot access file info: {str(e)}"}
     
     async def read_file(self, file_path: str, max_size: Optional[int] = None) -> Dict[str, Any]:
         """Safely read a file"""
+        return await self._run_blocking(self._read_file_sync, file_path, max_size)
+    
+    def _read_file_sync(self, file_path: str, max_size: Optional[int] = None) -> Dict[str, Any]:
+        """Blocking implementation of read_file"""
         try:
             path = Path(file_path)
             
-            if not self._is_path_allowed(path):
+            if not self._is_real_path_allowed(path):
                 return {"error": f"Access denied: Path not in allowed directories"}
             
             if not path.exists():
@@ -138,13 +331,14 @@ class SecureFileManager:
             if file_size > size_limit:
                 return {"error": f"File too large: {file_size} bytes (limit: {size_limit})"}
             
-            # Try to read as text first, then as binary
-            try:
-                content = path.read_text(encoding='utf-8')
+            # Try to read as text first, then report as binary without re-reading
+            with open(path, 'rb') as f:
+                data_size = os.fstat(f.fileno()).st_size
+                content = _decode_text(iter(partial(f.read, DECODE_CHUNK_SIZE), b''))
+            if content is not None:
                 content_type = "text"
-            except UnicodeDecodeError:
-                content = path.read_bytes()
-                content = f"<binary data: {len(content)} bytes>"
+            else:
+                content = f"<binary data: {data_size} bytes>"
                 content_type = "binary"
             
             return {
@@ -161,16 +355,23 @@ class SecureFileManager:
     
     async def write_file(self, file_path: str, content: str, create_dirs: bool = False) -> Dict[str, Any]:
         """Safely write to a file"""
+        return await self._run_blocking(self._write_file_sync, file_path, content, create_dirs)
+    
+    def _write_file_sync(self, file_path: str, content: str, create_dirs: bool = False) -> Dict[str, Any]:
+        """Blocking implementation of write_file"""
         try:
             path = Path(file_path)
             
-            if not self._is_path_allowed(path):
+            if not self._is_real_path_allowed(path):
                 return {"error": f"Access denied: Path not in allowed directories"}
             
             if not self._is_extension_allowed(path):
                 return {"error": f"File type not allowed: {path.suffix}"}
             
-            if len(content.encode('utf-8')) > MAX_FILE_SIZE:
+            # Encode once; the bytes are both size-checked and written
+            data = content.encode('utf-8')
+            size = len(data)
+            if size > MAX_FILE_SIZE:
                 return {"error": f"Content too large (limit: {MAX_FILE_SIZE} bytes)"}
             
             # Create parent directories if requested
@@ -182,12 +383,14 @@ class SecureFileManager:
                 return {"error": f"Parent directory does not exist: {path.parent}"}
             
             # Write the file
-            path.write_text(content, encoding='utf-8')
+            with open(path, 'wb') as f:
+                f.write(data)
+            self._invalidate_listings(path)
             
             return {
                 "success": True,
                 "message": f"File written successfully: {file_path}",
-                "size": len(content.encode('utf-8')),
+                "size": size,
                 "file_info": self._get_file_info(path)
             }
             
@@ -197,10 +400,14 @@ class SecureFileManager:
     
     async def list_directory(self, dir_path: str, include_hidden: bool = False) -> Dict[str, Any]:
         """List directory contents"""
+        return await self._run_blocking(self._list_directory_sync, dir_path, include_hidden)
+    
+    def _list_directory_sync(self, dir_path: str, include_hidden: bool = False) -> Dict[str, Any]:
+        """Blocking implementation of list_directory"""
         try:
             path = Path(dir_path)
             
-            if not self._is_path_allowed(path):
+            if not self._is_real_path_allowed(path):
                 return {"error": f"Access denied: Path not in allowed directories"}
             
             if not path.exists():
@@ -209,88 +416,183 @@ class SecureFileManager:
             if not path.is_dir():
                 return {"error": f"Not a directory: {dir_path}"}
             
-            items = []
-            for item in path.iterdir():
-                if not include_hidden and item.name.startswith('.'):
-                    continue
-                
-                item_info = self._get_file_info(item)
-                items.append(item_info)
+            # Reuse a recent listing if the directory has not changed since
+            cache_key = (os.path.abspath(path), include_hidden)
+            dir_mtime = os.stat(path).st_mtime_ns
+            now = time.monotonic()
+            cached = self._listing_cache.get(cache_key)
+            if cached and cached[1] == dir_mtime and now - cached[0] < LISTING_CACHE_TTL:
+                return cached[2]
             
-            # Sort by name
-            items.sort(key=lambda x: x.get('name', '').lower())
+            decorated = []
+            files = directories = 0
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if not include_hidden and entry.name.startswith('.'):
+                        continue
+                    
+                    item_info = self._get_file_info(Path(entry.path), _entry_stat(entry))
+                    files += bool(item_info.get('is_file'))
+                    directories += bool(item_info.get('is_dir'))
+                    decorated.append((entry.name.lower(), item_info))
             
-            return {
+            # Sort by the lowercased name computed during the scan
+            decorated.sort(key=itemgetter(0))
+            items = [item_info for _, item_info in decorated]
+            
+            result = {
                 "directory": str(path),
                 "items": items,
                 "total_items": len(items),
-                "files": len([i for i in items if i.get('is_file')]),
-                "directories": len([i for i in items if i.get('is_dir')])
+                "files": files,
+                "directories": directories
             }
             
+            with self._listing_lock:
+                if cache_key not in self._listing_cache and len(self._listing_cache) >= LISTING_CACHE_MAX:
+                    del self._listing_cache[next(iter(self._listing_cache))]
+                self._listing_cache[cache_key] = (now, dir_mtime, result)
+            return result
+            
         except Exception as e:
             logger.error(f"Error listing directory {dir_path}: {e}")
             return {"error": f"Failed to list directory: {str(e)}"}
     
-    async def search_files(self, search_dir: str, pattern: str, include_content: bool = False) -> Dict[str, Any]:
+    async def search_files(self, search_dir: str, pattern: str, include_content: bool = False,
+                           max_results: int = MAX_SEARCH_RESULTS, follow_symlinks: bool = False) -> Dict[str, Any]:
         """Search for files by name and optionally content"""
+        return await self._run_blocking(
+            self._search_files_sync, search_dir, pattern, include_content, max_results, follow_symlinks
+        )
+    
+    def _search_files_sync(self, search_dir: str, pattern: str, include_content: bool = False,
+                           max_results: int = MAX_SEARCH_RESULTS, follow_symlinks: bool = False) -> Dict[str, Any]:
+        """Blocking implementation of search_files"""
         try:
             path = Path(search_dir)
             
-            if not self._is_path_allowed(path):
+            if not self._is_real_path_allowed(path):
                 return {"error": f"Access denied: Path not in allowed directories"}
             
             if not path.exists() or not path.is_dir():
                 return {"error": f"Invalid search directory: {search_dir}"}
             
             matches = []
+            truncated = False
+            
+            # Prepare the matchers once per search
+            pattern_lower = pattern.lower()
+            if pattern.isascii():
+                # Walk with bytes paths so names are matched without decoding
+                name_pattern = content_pattern = pattern_lower.encode('ascii')
+                walk_root = os.fsencode(path)
+                search_content = self._search_content_bytes
+            else:
+                # bytes.lower() only folds ASCII, so decode and use a regex instead
+                name_pattern = pattern_lower
+                walk_root = str(path)
+                content_pattern = re.compile(re.escape(pattern), re.IGNORECASE)
+                search_content = self._search_content_text
             
             # Search recursively
-            for item in path.rglob('*'):
-                if not self._is_path_allowed(item):
+            for entry in _walk_entries(walk_root, follow_symlinks, self._is_real_path_allowed):
+                # Check filename match
+                if name_pattern not in entry.name.lower():
                     continue
                 
-                # Check filename match
-                if pattern.lower() in item.name.lower():
-                    match_info = self._get_file_info(item)
-                    match_info["match_type"] = "filename"
-                    
-                    # Optionally search content
-                    if include_content and item.is_file() and self._is_extension_allowed(item):
-                        try:
-                            if item.stat().st_size <= MAX_FILE_SIZE:
-                                content = item.read_text(encoding='utf-8')
-                                if pattern.lower() in content.lower():
-                                    match_info["match_type"] = "content"
-                                    # Find line numbers with matches
-                                    lines = content.split('\n')
-                                    matching_lines = []
-                                    for i, line in enumerate(lines, 1):
-                                        if pattern.lower() in line.lower():
-                                            matching_lines.append({"line": i, "text": line.strip()})
-                                    match_info["matching_lines"] = matching_lines[:10]  # Limit to 10
-                        except (UnicodeDecodeError, PermissionError):
-                            pass  # Skip files that can't be read
-                    
-                    matches.append(match_info)
+                # Only matches are decoded back to str paths
+                item = Path(os.fsdecode(entry.path))
+                # Lexical check for plain entries; resolve only symlinks or
+                # paths reached through a symlinked search root
+                if entry.is_symlink() or not self._is_path_allowed(item):
+                    if not self._is_real_path_allowed(item):
+                        continue
+                
+                # Stop walking at the first match beyond the limit
+                if len(matches) >= max_results:
+                    truncated = True
+                    break
+                
+                entry_stat = _entry_stat(entry)
+                match_info = self._get_file_info(item, entry_stat)
+                match_info["match_type"] = "filename"
+                
+                # Optionally search content, rejecting ineligible files from the
+                # cached metadata before opening anything
+                if (include_content and entry_stat is not None
+                        and stat.S_ISREG(entry_stat.st_mode)
+                        and entry_stat.st_size <= MAX_FILE_SIZE
+                        and self._is_extension_allowed(item)):
+                    try:
+                        matching_lines = search_content(item, content_pattern)
+                        if matching_lines is not None:
+                            match_info["match_type"] = "content"
+                            match_info["matching_lines"] = matching_lines
+                    except (UnicodeDecodeError, OSError):
+                        pass  # Skip files that can't be read
+                
+                matches.append(match_info)
             
             return {
                 "search_directory": str(path),
                 "pattern": pattern,
                 "matches": matches,
-                "total_matches": len(matches)
+                "total_matches": len(matches),
+                "truncated": truncated
             }
             
         except Exception as e:
             logger.error(f"Error searching files in {search_dir}: {e}")
             return {"error": f"Failed to search files: {str(e)}"}
     
+    def _search_content_text(self, file_path: Path, pattern_re: "re.Pattern[str]", max_lines: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """Return up to max_lines lines matching a compiled pattern, or None if nothing matches"""
+        content = file_path.read_text(encoding='utf-8')
+        if not pattern_re.search(content):
+            return None
+        matching_lines = []
+        for i, line in enumerate(io.StringIO(content), 1):
+            if pattern_re.search(line):
+                matching_lines.append({"line": i, "text": line.strip()})
+                if len(matching_lines) == max_lines:
+                    break
+        return matching_lines
+    
+    def _search_content_bytes(self, file_path: Path, pattern_bytes: bytes, max_lines: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """Return up to max_lines lines containing a lowercase ASCII pattern, or None if nothing matches"""
+        with open(file_path, 'rb') as f:
+            # Scan the raw bytes first; most candidates never match
+            if not _file_contains_lowered(f, pattern_bytes):
+                return None
+            f.seek(0)
+            data = f.read()
+        
+        # Only decode the lines that contain a hit
+        hit = _find_lowered(data, pattern_bytes)
+        matching_lines = []
+        line_no, counted = 1, 0
+        while hit != -1 and len(matching_lines) < max_lines:
+            line_start = data.rfind(b'\n', 0, hit) + 1
+            line_end = data.find(b'\n', hit)
+            if line_end == -1:
+                line_end = len(data)
+            line_no += data.count(b'\n', counted, line_start)
+            counted = line_start
+            text = data[line_start:line_end].decode('utf-8')
+            matching_lines.append({"line": line_no, "text": text.strip()})
+            hit = _find_lowered(data, pattern_bytes, line_end + 1)
+        return matching_lines
+    
     async def get_file_hash(self, file_path: str) -> Dict[str, Any]:
         """Get file hash for integrity checking"""
+        return await self._run_blocking(self._get_file_hash_sync, file_path)
+    
+    def _get_file_hash_sync(self, file_path: str) -> Dict[str, Any]:
+        """Blocking implementation of get_file_hash"""
         try:
             path = Path(file_path)
             
-            if not self._is_path_allowed(path):
+            if not self._is_real_path_allowed(path):
                 return {"error": f"Access denied: Path not in allowed directories"}
             
             if not path.exists() or not path.is_file():
@@ -299,15 +601,19 @@ class SecureFileManager:
             if path.stat().st_size > MAX_FILE_SIZE:
                 return {"error": f"File too large for hashing"}
             
-            # Calculate multiple hashes
-            content = path.read_bytes()
+            # Calculate multiple hashes in one chunked pass over the file
+            hashers = {"md5": hashlib.md5(), "sha1": hashlib.sha1(), "sha256": hashlib.sha256()}
+            with open(path, 'rb') as f:
+                parallel = os.fstat(f.fileno()).st_size > HASH_CHUNK_SIZE
+                size = _hash_file(f, hashers.values(), parallel)
+            digests = {name: hasher.hexdigest() for name, hasher in hashers.items()}
             
             return {
                 "file": str(path),
-                "size": len(content),
-                "md5": hashlib.md5(content).hexdigest(),
-                "sha1": hashlib.sha1(content).hexdigest(),
-                "sha256": hashlib.sha256(content).hexdigest()
+                "size": size,
+                "md5": digests["md5"],
+                "sha1": digests["sha1"],
+                "sha256": digests["sha256"]
             }
             
         except Exception as e:
@@ -402,6 +708,16 @@ async def handle_list_tools() -> ListToolsResult:
                         "type": "boolean",
                         "description": "Also search within file contents",
                         "default": False
+                    },
+                    "max_results": {
+                        "type": "integer",
+                        "description": "Maximum number of matches to return",
+                        "default": MAX_SEARCH_RESULTS
+                    },
+                    "follow_symlinks": {
+                        "type": "boolean",
+                        "description": "Descend into symlinked directories that stay inside allowed directories",
+                        "default": False
                     }
                 },
                 "required": ["search_directory", "pattern"]
@@ -530,13 +846,14 @@ async def handle_list_directory(arguments: Dict[str, Any]) -> CallToolResult:
             isError=True
         )
     
-    response = f"📁 Directory: {result['directory']}\n"
-    response += f"📊 Total items: {result['total_items']} ({result['files']} files, {result['directories']} directories)\n\n"
+    parts = [LIST_HEADER_TMPL.format_map(result)]
     
     for item in result['items']:
-        icon = "📁" if item.get('is_dir') else "📄"
+        icon = ICON_DIR if item.get('is_dir') else ICON_FILE
         size = f" ({item['size']} bytes)" if item.get('is_file') else ""
-        response += f"{icon} {item['name']}{size}\n"
+        parts.append(f"{icon} {item['name']}{size}")
+    
+    response = "\n".join(parts) + "\n"
     
     return CallToolResult(
         content=[TextContent(type="text", text=response)]
@@ -548,8 +865,12 @@ async def handle_search_files(arguments: Dict[str, Any]) -> CallToolResult:
     search_directory = arguments["search_directory"]
     pattern = arguments["pattern"]
     include_content = arguments.get("include_content", False)
+    max_results = arguments.get("max_results", MAX_SEARCH_RESULTS)
+    follow_symlinks = arguments.get("follow_symlinks", False)
     
-    result = await file_manager.search_files(search_directory, pattern, include_content)
+    result = await file_manager.search_files(
+        search_directory, pattern, include_content, max_results, follow_symlinks
+    )
     
     if "error" in result:
         return CallToolResult(
@@ -557,19 +878,25 @@ async def handle_search_files(arguments: Dict[str, Any]) -> CallToolResult:
             isError=True
         )
     
-    response = f"🔍 Search Results\n"
-    response += f"📁 Directory: {result['search_directory']}\n"
-    response += f"🎯 Pattern: '{result['pattern']}'\n"
-    response += f"📊 Found: {result['total_matches']} matches\n\n"
+    parts = [
+        "🔍 Search Results",
+        f"📁 Directory: {result['search_directory']}",
+        f"🎯 Pattern: '{result['pattern']}'",
+        f"📊 Found: {result['total_matches']} matches"
+        + (" (limit reached, search stopped early)" if result['truncated'] else ""),
+        ""
+    ]
     
     for match in result['matches']:
-        icon = "📁" if match.get('is_dir') else "📄"
-        response += f"{icon} {match['path']} ({match['match_type']} match)\n"
+        icon = ICON_DIR if match.get('is_dir') else ICON_FILE
+        parts.append(f"{icon} {match['path']} ({match['match_type']} match)")
         
         if match.get('matching_lines'):
-            response += "   Content matches:\n"
+            parts.append("   Content matches:")
             for line_info in match['matching_lines'][:3]:  # Show first 3 lines
-                response += f"   Line {line_info['line']}: {line_info['text'][:80]}...\n"
+                parts.append(f"   Line {line_info['line']}: {line_info['text'][:80]}...")
+    
+    response = "\n".join(parts) + "\n"
     
     return CallToolResult(
         content=[TextContent(type="text", text=response)]
@@ -583,7 +910,7 @@ async def handle_get_file_info(arguments: Dict[str, Any]) -> CallToolResult:
     try:
         path = Path(file_path)
         
-        if not file_manager._is_path_allowed(path):
+        if not file_manager._is_real_path_allowed(path):
             return CallToolResult(
                 content=[TextContent(type="text", text="Error: Access denied - path not in allowed directories")],
                 isError=True
@@ -753,9 +1080,23 @@ async def main():
         )
 
 
+def _run(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        _run(main())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
@@ -9,8 +9,7 @@ Configuration:
   Default allowed directories: current working directory and user Documents folder.
 """
 
-from . import main
+from . import _run, main
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    _run(main())
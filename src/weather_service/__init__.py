@@ -17,16 +17,20 @@ Features:
 """
 
 import asyncio
-import json
 import logging
+import math
 import os
 import sys
+import time
+from collections import Counter, OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import aiohttp
 import asyncio
 from pathlib import Path
 
+from . import _json
+
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
@@ -49,9 +53,57 @@ logger = logging.getLogger(__name__)
 DEFAULT_API_KEY = "demo_key"  # Replace with actual API key
 BASE_URL = "http://api.openweathermap.org/data/2.5"
 
-# Simple in-memory cache
-weather_cache = {}
+# HTTP client configuration (one pooled session for the process lifetime)
+HTTP_TIMEOUT = 30  # seconds
+# aiohttp sets Accept-Encoding itself to the codings it can decode (br when
+# Brotli is installed), so only the User-Agent is pinned here
+HTTP_HEADERS = {
+    "User-Agent": "weather-service-mcp/1.0",
+}
+
+# Simple in-memory LRU cache: key -> (data, stored_at, expires_at), with
+# times on the time.monotonic() clock
+weather_cache = OrderedDict()
 CACHE_DURATION = timedelta(minutes=10)
+CACHE_MAX = 256
+
+
+def _ttl_from_env(name: str, default: timedelta) -> timedelta:
+    """Read a cache TTL in minutes from an environment variable"""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        minutes = float(value)
+        if not math.isfinite(minutes) or minutes < 0:
+            raise ValueError(value)
+        return timedelta(minutes=minutes)
+    except (ValueError, OverflowError):
+        logger.warning("Ignoring invalid %s=%r; using %s", name, value, default)
+        return default
+
+
+# Per-endpoint TTLs: current conditions change quickly, forecasts do not.
+# Override with WEATHER_TTL_WEATHER / WEATHER_TTL_FORECAST (minutes).
+ENDPOINT_TTL = {
+    "weather": _ttl_from_env("WEATHER_TTL_WEATHER", CACHE_DURATION),
+    "forecast": _ttl_from_env("WEATHER_TTL_FORECAST", timedelta(minutes=60)),
+}
+
+# Requests currently in flight, so concurrent identical calls share one fetch
+_inflight: Dict[Tuple, asyncio.Future] = {}
+
+# Cache pressure watermarks: TTLs shrink linearly between low and high, and
+# reaching high evicts the older half of the cache
+_CACHE_LOW = 0.7 * CACHE_MAX
+_CACHE_HIGH = 0.9 * CACHE_MAX
+
+
+def _effective_ttl(size: int, ttl: timedelta = CACHE_DURATION) -> float:
+    """TTL in seconds for a new entry, given the current cache size"""
+    pressure = min(1.0, max(0.0, (size - _CACHE_LOW) / (_CACHE_HIGH - _CACHE_LOW)))
+    return ttl.total_seconds() * (1 - pressure)
+
 
 # MCP Server
 server = Server("weather-service-mcp-server")
@@ -62,12 +114,26 @@ class WeatherService:
     
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.getenv("OPENWEATHER_API_KEY", DEFAULT_API_KEY)
-        self.session = None
+        self.session: Optional[aiohttp.ClientSession] = None
     
     async def get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+        """Get the shared HTTP session, creating it on first use"""
+        if self.session is None:
+            # Keep connections alive and cache DNS so repeat requests to the
+            # API host skip the TCP/DNS setup
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+                json_serialize=_json.dumps,
+                headers=HTTP_HEADERS
+            )
         return self.session
     
     async def close(self):
@@ -75,26 +141,39 @@ class WeatherService:
         if self.session and not self.session.closed:
             await self.session.close()
     
-    def _cache_key(self, endpoint: str, params: Dict[str, Any]) -> str:
+    def _cache_key(self, endpoint: str, params: Dict[str, Any]) -> Tuple:
         """Generate cache key"""
-        sorted_params = sorted(params.items())
-        return f"{endpoint}:{hash(str(sorted_params))}"
+        # The params themselves form the key, so distinct requests never collide;
+        # a frozenset ignores insertion order without sorting
+        return (endpoint, frozenset(params.items()))
     
-    def _is_cache_valid(self, timestamp: datetime) -> bool:
+    def _is_cache_valid(self, expires_at: float) -> bool:
         """Check if cached data is still valid"""
-        return datetime.now() - timestamp < CACHE_DURATION
+        return time.monotonic() < expires_at
     
     async def _make_api_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Make API request with caching"""
         # Check cache first
         cache_key = self._cache_key(endpoint, params)
         if cache_key in weather_cache:
-            cached_data, timestamp = weather_cache[cache_key]
-            if self._is_cache_valid(timestamp):
-                logger.info(f"Cache hit for {endpoint}")
+            cached_data, _, expires_at = weather_cache[cache_key]
+            if self._is_cache_valid(expires_at):
+                weather_cache.move_to_end(cache_key)
+                logger.info("Cache hit for %s", endpoint)
                 return cached_data
         
-        # Make API request
+        # Share a request that is already in flight for the same key. The
+        # fetch runs as its own task, so cancelling any one caller (including
+        # the one that started it) leaves it running for the others.
+        task = _inflight.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(endpoint, params, cache_key))
+            _inflight[cache_key] = task
+            task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+    
+    async def _fetch(self, endpoint: str, params: Dict[str, Any], cache_key: Tuple) -> Dict[str, Any]:
+        """Fetch from the API and cache successful responses"""
         params["appid"] = self.api_key
         url = f"{BASE_URL}/{endpoint}"
         
@@ -108,19 +187,26 @@ class WeatherService:
                 elif response.status != 200:
                     return {"error": f"API error: {response.status}"}
                 
-                data = await response.json()
+                # Parse the raw body ourselves so orjson is used when available
+                data = _json.loads(await response.read())
                 
-                # Cache the result
-                weather_cache[cache_key] = (data, datetime.now())
-                logger.info(f"Cached new data for {endpoint}")
+                # Cache the result; under pressure drop the older half first
+                weather_cache.pop(cache_key, None)
+                if len(weather_cache) >= _CACHE_HIGH:
+                    for _ in range(len(weather_cache) // 2):
+                        weather_cache.popitem(last=False)
+                now = time.monotonic()
+                ttl = ENDPOINT_TTL.get(endpoint, CACHE_DURATION)
+                weather_cache[cache_key] = (data, now, now + _effective_ttl(len(weather_cache), ttl))
+                logger.info("Cached new data for %s", endpoint)
                 
                 return data
                 
         except aiohttp.ClientError as e:
-            logger.error(f"HTTP client error: {e}")
+            logger.error("HTTP client error: %s", e)
             return {"error": f"Network error: {str(e)}"}
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
+            logger.error("Unexpected error: %s", e)
             return {"error": f"Unexpected error: {str(e)}"}
     
     async def get_current_weather(self, location: str, units: str = "metric") -> Dict[str, Any]:
@@ -148,144 +234,124 @@ class WeatherService:
 weather_service = WeatherService()
 
 
+# Sub-schemas shared by several tools (treated as read-only)
+_UNITS_SCHEMA = {
+    "type": "string",
+    "enum": ["metric", "imperial", "kelvin"],
+    "description": "Temperature units",
+    "default": "metric"
+}
+
+_LAT_SCHEMA = {
+    "type": "number",
+    "description": "Latitude coordinate",
+    "minimum": -90,
+    "maximum": 90
+}
+
+_LON_SCHEMA = {
+    "type": "number",
+    "description": "Longitude coordinate",
+    "minimum": -180,
+    "maximum": 180
+}
+
+# Static tool listing, built once at import
+_TOOLS = [
+    Tool(
+        name="get_current_weather",
+        description="Get current weather conditions for a specific location",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "location": {
+                    "type": "string",
+                    "description": "City name, state/country (e.g., 'London,UK' or 'New York,NY,US')"
+                },
+                "units": {
+                    **_UNITS_SCHEMA,
+                    "description": "Temperature units (metric=Celsius, imperial=Fahrenheit, kelvin=Kelvin)"
+                }
+            },
+            "required": ["location"]
+        }
+    ),
+    Tool(
+        name="get_weather_by_coordinates",
+        description="Get current weather by latitude and longitude",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "latitude": _LAT_SCHEMA,
+                "longitude": _LON_SCHEMA,
+                "units": _UNITS_SCHEMA
+            },
+            "required": ["latitude", "longitude"]
+        }
+    ),
+    Tool(
+        name="get_weather_forecast",
+        description="Get 5-day weather forecast for a location",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "location": {
+                    "type": "string",
+                    "description": "City name, state/country"
+                },
+                "units": _UNITS_SCHEMA
+            },
+            "required": ["location"]
+        }
+    ),
+    Tool(
+        name="get_forecast_by_coordinates",
+        description="Get 5-day weather forecast by coordinates",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "latitude": _LAT_SCHEMA,
+                "longitude": _LON_SCHEMA,
+                "units": _UNITS_SCHEMA
+            },
+            "required": ["latitude", "longitude"]
+        }
+    ),
+    Tool(
+        name="parse_weather_data",
+        description="Parse and format weather data into human-readable format",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "weather_data": {
+                    "type": "object",
+                    "description": "Raw weather data from API"
+                }
+            },
+            "required": ["weather_data"]
+        }
+    )
+]
+_TOOLS_RESULT = ListToolsResult(tools=_TOOLS)
+
+
 @server.list_tools()
 async def handle_list_tools() -> ListToolsResult:
     """List available weather tools"""
-    tools = [
-        Tool(
-            name="get_current_weather",
-            description="Get current weather conditions for a specific location",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "location": {
-                        "type": "string",
-                        "description": "City name, state/country (e.g., 'London,UK' or 'New York,NY,US')"
-                    },
-                    "units": {
-                        "type": "string",
-                        "enum": ["metric", "imperial", "kelvin"],
-                        "description": "Temperature units (metric=Celsius, imperial=Fahrenheit, kelvin=Kelvin)",
-                        "default": "metric"
-                    }
-                },
-                "required": ["location"]
-            }
-        ),
-        Tool(
-            name="get_weather_by_coordinates",
-            description="Get current weather by latitude and longitude",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "latitude": {
-                        "type": "number",
-                        "description": "Latitude coordinate",
-                        "minimum": -90,
-                        "maximum": 90
-                    },
-                    "longitude": {
-                        "type": "number",
-                        "description": "Longitude coordinate",
-                        "minimum": -180,
-                        "maximum": 180
-                    },
-                    "units": {
-                        "type": "string",
-                        "enum": ["metric", "imperial", "kelvin"],
-                        "description": "Temperature units",
-                        "default": "metric"
-                    }
-                },
-                "required": ["latitude", "longitude"]
-            }
-        ),
-        Tool(
-            name="get_weather_forecast",
-            description="Get 5-day weather forecast for a location",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "location": {
-                        "type": "string",
-                        "description": "City name, state/country"
-                    },
-                    "units": {
-                        "type": "string",
-                        "enum": ["metric", "imperial", "kelvin"],
-                        "description": "Temperature units",
-                        "default": "metric"
-                    }
-                },
-                "required": ["location"]
-            }
-        ),
-        Tool(
-            name="get_forecast_by_coordinates",
-            description="Get 5-day weather forecast by coordinates",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "latitude": {
-                        "type": "number",
-                        "description": "Latitude coordinate",
-                        "minimum": -90,
-                        "maximum": 90
-                    },
-                    "longitude": {
-                        "type": "number",
-                        "description": "Longitude coordinate",
-                        "minimum": -180,
-                        "maximum": 180
-                    },
-                    "units": {
-                        "type": "string",
-                        "enum": ["metric", "imperial", "kelvin"],
-                        "description": "Temperature units",
-                        "default": "metric"
-                    }
-                },
-                "required": ["latitude", "longitude"]
-            }
-        ),
-        Tool(
-            name="parse_weather_data",
-            description="Parse and format weather data into human-readable format",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "weather_data": {
-                        "type": "object",
-                        "description": "Raw weather data from API"
-                    }
-                },
-                "required": ["weather_data"]
-            }
-        )
-    ]
-    
-    return ListToolsResult(tools=tools)
+    return _TOOLS_RESULT
 
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
     """Handle tool execution"""
     try:
-        if name == "get_current_weather":
-            return await handle_current_weather(arguments)
-        elif name == "get_weather_by_coordinates":
-            return await handle_weather_by_coordinates(arguments)
-        elif name == "get_weather_forecast":
-            return await handle_weather_forecast(arguments)
-        elif name == "get_forecast_by_coordinates":
-            return await handle_forecast_by_coordinates(arguments)
-        elif name == "parse_weather_data":
-            return await handle_parse_weather_data(arguments)
-        else:
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
     
     except Exception as e:
-        logger.error(f"Error executing tool {name}: {e}")
+        logger.error("Error executing tool %s: %s", name, e)
         return CallToolResult(
             content=[TextContent(type="text", text=f"Error: {str(e)}")],
             isError=True
@@ -386,17 +452,45 @@ async def handle_parse_weather_data(arguments: Dict[str, Any]) -> CallToolResult
         # Forecast data
         formatted = format_forecast(weather_data, "metric")
     else:
-        formatted = f"Raw weather data:\n{json.dumps(weather_data, indent=2)}"
+        formatted = f"Raw weather data:\n{_truncated_json(weather_data)}"
     
     return CallToolResult(
         content=[TextContent(type="text", text=formatted)]
     )
 
 
+# Tool name -> handler coroutine
+_TOOL_HANDLERS = {
+    "get_current_weather": handle_current_weather,
+    "get_weather_by_coordinates": handle_weather_by_coordinates,
+    "get_weather_forecast": handle_weather_forecast,
+    "get_forecast_by_coordinates": handle_forecast_by_coordinates,
+    "parse_weather_data": handle_parse_weather_data,
+}
+
+
+# Longest JSON echo included in invalid/raw weather data messages
+JSON_PREVIEW_CHARS = 2048
+
+
+def _truncated_json(data: Any, max_chars: int = JSON_PREVIEW_CHARS) -> str:
+    """Indented JSON for messages, cut off after max_chars characters"""
+    text = _json.dumps(data, indent=True)
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}\n... ({len(text) - max_chars} more characters truncated)"
+
+
+# Day and month names for forecast headings, indexed like weekday()/month
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = ("", "January", "February", "March", "April", "May", "June", "July",
+           "August", "September", "October", "November", "December")
+
+
 def format_current_weather(data: Dict[str, Any], units: str) -> str:
     """Format current weather data into readable text"""
     if "main" not in data or "weather" not in data:
-        return f"Invalid weather data:\n{json.dumps(data, indent=2)}"
+        return f"Invalid weather data:\n{_truncated_json(data)}"
     
     # Unit symbols
     temp_unit = "°C" if units == "metric" else "°F" if units == "imperial" else "K"
@@ -412,38 +506,43 @@ def format_current_weather(data: Dict[str, Any], units: str) -> str:
     wind = data.get("wind", {})
     clouds = data.get("clouds", {})
     
-    formatted = f"""🌤️ Current Weather for {location}
-
-🌡️ Temperature: {main['temp']}{temp_unit} (feels like {main['feels_like']}{temp_unit})
-📊 Conditions: {weather['main']} - {weather['description'].title()}
-💧 Humidity: {main['humidity']}%
-🌬️ Wind: {wind.get('speed', 0)} {speed_unit}"""
-    
+    wind_line = f"🌬️ Wind: {wind.get('speed', 0)} {speed_unit}"
     if wind.get('deg'):
-        formatted += f" from {wind['deg']}°"
-    
-    formatted += f"""
-☁️ Cloudiness: {clouds.get('all', 0)}%
-🔽 Pressure: {main['pressure']} hPa"""
+        wind_line += f" from {wind['deg']}°"
+    
+    # Collect lines and join once at the end
+    parts = [
+        f"🌤️ Current Weather for {location}",
+        "",
+        f"🌡️ Temperature: {main['temp']}{temp_unit} (feels like {main['feels_like']}{temp_unit})",
+        f"📊 Conditions: {weather['main']} - {weather['description'].title()}",
+        f"💧 Humidity: {main['humidity']}%",
+        wind_line,
+        f"☁️ Cloudiness: {clouds.get('all', 0)}%",
+        f"🔽 Pressure: {main['pressure']} hPa"
+    ]
     
     if 'visibility' in data:
-        formatted += f"\n👁️ Visibility: {data['visibility']/1000:.1f} km"
+        parts.append(f"👁️ Visibility: {data['visibility']/1000:.1f} km")
     
     # Add sunrise/sunset if available
     if 'sys' in data and 'sunrise' in data['sys']:
-        sunrise = datetime.fromtimestamp(data['sys']['sunrise']).strftime('%H:%M')
-        sunset = datetime.fromtimestamp(data['sys']['sunset']).strftime('%H:%M')
-        formatted += f"\n🌅 Sunrise: {sunrise} | 🌇 Sunset: {sunset}"
+        sunrise = datetime.fromtimestamp(data['sys']['sunrise'])
+        sunset = datetime.fromtimestamp(data['sys']['sunset'])
+        sunrise = f"{sunrise.hour:02d}:{sunrise.minute:02d}"
+        sunset = f"{sunset.hour:02d}:{sunset.minute:02d}"
+        parts.append(f"🌅 Sunrise: {sunrise} | 🌇 Sunset: {sunset}")
     
-    formatted += f"\n\n📅 Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    parts.append("")
+    parts.append(f"📅 Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    return formatted
+    return "\n".join(parts)
 
 
 def format_forecast(data: Dict[str, Any], units: str) -> str:
     """Format forecast data into readable text"""
     if "list" not in data or "city" not in data:
-        return f"Invalid forecast data:\n{json.dumps(data, indent=2)}"
+        return f"Invalid forecast data:\n{_truncated_json(data)}"
     
     temp_unit = "°C" if units == "metric" else "°F" if units == "imperial" else "K"
     
@@ -452,116 +551,95 @@ def format_forecast(data: Dict[str, Any], units: str) -> str:
     if country:
         city += f", {country}"
     
-    formatted = f"📅 5-Day Weather Forecast for {city}\n{'='*50}\n"
+    # Collect lines and join once at the end
+    parts = [f"📅 5-Day Weather Forecast for {city}", "=" * 50]
     
-    # Group forecasts by day
+    # Group forecasts by day, decoding each timestamp once
     daily_forecasts = {}
     for item in data["list"]:
         date_time = datetime.fromtimestamp(item["dt"])
-        date_key = date_time.strftime('%Y-%m-%d')
-        
-        if date_key not in daily_forecasts:
-            daily_forecasts[date_key] = []
-        daily_forecasts[date_key].append(item)
+        daily_forecasts.setdefault(date_time.date(), []).append((date_time, item))
     
     # Format each day
-    for date_key in sorted(daily_forecasts.keys())[:5]:  # Only show 5 days
+    for date_key in sorted(daily_forecasts)[:5]:  # Only show 5 days
         day_data = daily_forecasts[date_key]
-        date_obj = datetime.strptime(date_key, '%Y-%m-%d')
-        day_name = date_obj.strftime('%A, %B %d')
+        first = day_data[0][0]
+        day_name = f"{_WEEKDAYS[first.weekday()]}, {_MONTHS[first.month]} {first.day:02d}"
         
-        formatted += f"\n📆 {day_name}\n"
-        formatted += "-" * 30 + "\n"
+        parts.append("")
+        parts.append(f"📆 {day_name}")
+        parts.append("-" * 30)
         
-        # Find min/max temps for the day
-        temps = [item["main"]["temp"] for item in day_data]
-        min_temp = min(temps)
-        max_temp = max(temps)
+        # One pass for min/max temps, condition counts and key times
+        min_temp, max_temp = math.inf, -math.inf
+        conditions = Counter()
+        key_times = []
+        for date_time, item in day_data:
+            temp = item["main"]["temp"]
+            if temp < min_temp:
+                min_temp = temp
+            if temp > max_temp:
+                max_temp = temp
+            conditions[item["weather"][0]["description"]] += 1
+            if date_time.hour in (6, 12, 18):  # Morning, noon, evening
+                key_times.append((date_time, item))
         
-        # Get most common weather condition
-        conditions = [item["weather"][0]["description"] for item in day_data]
-        main_condition = max(set(conditions), key=conditions.count)
+        # Most common weather condition
+        main_condition = conditions.most_common(1)[0][0]
         
-        formatted += f"🌡️ Temperature: {min_temp:.1f}{temp_unit} - {max_temp:.1f}{temp_unit}\n"
-        formatted += f"🌤️ Conditions: {main_condition.title()}\n"
+        parts.append(f"🌡️ Temperature: {min_temp:.1f}{temp_unit} - {max_temp:.1f}{temp_unit}")
+        parts.append(f"🌤️ Conditions: {main_condition.title()}")
         
         # Show detailed forecast for key times
-        key_times = []
-        for item in day_data:
-            hour = datetime.fromtimestamp(item["dt"]).hour
-            if hour in [6, 12, 18]:  # Morning, noon, evening
-                key_times.append(item)
-        
         if key_times:
-            formatted += "⏰ Hourly Details:\n"
-            for item in key_times:
-                time_str = datetime.fromtimestamp(item["dt"]).strftime('%H:%M')
+            parts.append("⏰ Hourly Details:")
+            for date_time, item in key_times:
+                time_str = f"{date_time.hour:02d}:{date_time.minute:02d}"
                 temp = item["main"]["temp"]
                 desc = item["weather"][0]["description"]
-                formatted += f"  {time_str}: {temp}{temp_unit}, {desc}\n"
+                parts.append(f"  {time_str}: {temp}{temp_unit}, {desc}")
         
-        formatted += "\n"
-    
-    formatted += f"📊 Data provided by OpenWeatherMap\n"
-    formatted += f"🕐 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-    
-    return formatted
+        parts.append("")
+    
+    parts.append("📊 Data provided by OpenWeatherMap")
+    parts.append(f"🕐 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    return "\n".join(parts)
+
+
+# Static resource listing, built once at import
+_RESOURCES_RESULT = ListResourcesResult(resources=[
+    Resource(
+        uri="weather://cache",
+        name="Weather Cache Status",
+        description="Information about cached weather data",
+        mimeType="application/json"
+    ),
+    Resource(
+        uri="weather://api-info",
+        name="Weather API Information",
+        description="Information about the weather API service",
+        mimeType="text/plain"
+    )
+])
 
 
 @server.list_resources()
 async def handle_list_resources() -> ListResourcesResult:
     """List available weather resources"""
-    resources = [
-        Resource(
-            uri="weather://cache",
-            name="Weather Cache Status",
-            description="Information about cached weather data",
-            mimeType="application/json"
-        ),
-        Resource(
-            uri="weather://api-info",
-            name="Weather API Information",
-            description="Information about the weather API service",
-            mimeType="text/plain"
-        )
-    ]
-    
-    return ListResourcesResult(resources=resources)
+    return _RESOURCES_RESULT
 
 
-@server.get_resource()
-async def handle_get_resource(uri: str) -> GetResourceResult:
-    """Handle resource requests"""
-    try:
-        if uri == "weather://cache":
-            cache_info = {
-                "cache_entries": len(weather_cache),
-                "cache_duration_minutes": CACHE_DURATION.total_seconds() / 60,
-                "cached_items": []
-            }
-            
-            for key, (data, timestamp) in weather_cache.items():
-                cache_info["cached_items"].append({
-                    "key": key,
-                    "timestamp": timestamp.isoformat(),
-                    "age_minutes": (datetime.now() - timestamp).total_seconds() / 60,
-                    "valid": weather_service._is_cache_valid(timestamp)
-                })
-            
-            return GetResourceResult(
-                contents=[
-                    TextContent(type="text", text=json.dumps(cache_info, indent=2))
-                ]
-            )
-            
-        elif uri == "weather://api-info":
-            api_info = f"""Weather Service API Information
+# Static parts of the weather://api-info text; only the key status and the
+# entry count are filled in per request
+_API_INFO_HEAD = f"""Weather Service API Information
 =====================================
 
 Service Provider: OpenWeatherMap
 Base URL: {BASE_URL}
-API Key Status: {'Configured' if weather_service.api_key != DEFAULT_API_KEY else 'Using Demo Key'}
+"""
 
+_API_INFO_MIDDLE = f"""
 Available Endpoints:
 - Current Weather: /weather
 - 5-Day Forecast: /forecast
@@ -575,12 +653,59 @@ Supported Features:
 ✅ Error handling and validation
 
 Cache Configuration:
-- Duration: {CACHE_DURATION.total_seconds() / 60} minutes
-- Current entries: {len(weather_cache)}
+- Current weather: {ENDPOINT_TTL['weather'].total_seconds() / 60} minutes
+- Forecasts: {ENDPOINT_TTL['forecast'].total_seconds() / 60} minutes
+"""
 
+_API_INFO_TAIL = """
 Note: To use real weather data, set the OPENWEATHER_API_KEY environment variable.
 Get your free API key at: https://openweathermap.org/api
 """
+
+
+@server.get_resource()
+async def handle_get_resource(uri: str) -> GetResourceResult:
+    """Handle resource requests"""
+    try:
+        if uri == "weather://cache":
+            cache_info = {
+                "cache_entries": len(weather_cache),
+                "cache_duration_minutes": CACHE_DURATION.total_seconds() / 60,
+                "endpoint_ttl_minutes": {
+                    endpoint: ttl.total_seconds() / 60 for endpoint, ttl in ENDPOINT_TTL.items()
+                },
+                "cached_items": []
+            }
+            
+            # Read both clocks once; per-entry ages are plain float arithmetic
+            now = time.monotonic()
+            wall_now = time.time()
+            cached_items = cache_info["cached_items"]
+            for key, (data, stored_at, expires_at) in weather_cache.items():
+                age = now - stored_at
+                cached_items.append({
+                    "key": f"{key[0]}:{dict(sorted(key[1]))}",
+                    "timestamp": datetime.fromtimestamp(wall_now - age),
+                    "age_minutes": age / 60,
+                    "valid": now < expires_at
+                })
+            
+            # The encoder writes the timestamps as ISO 8601 itself
+            return GetResourceResult(
+                contents=[
+                    TextContent(type="text", text=_json.dumps(cache_info, indent=True))
+                ]
+            )
+            
+        elif uri == "weather://api-info":
+            api_key_status = 'Configured' if weather_service.api_key != DEFAULT_API_KEY else 'Using Demo Key'
+            api_info = (
+                _API_INFO_HEAD
+                + f"API Key Status: {api_key_status}\n"
+                + _API_INFO_MIDDLE
+                + f"- Current entries: {len(weather_cache)}\n"
+                + _API_INFO_TAIL
+            )
             
             return GetResourceResult(
                 contents=[
@@ -592,7 +717,7 @@ Get your free API key at: https://openweathermap.org/api
             raise ValueError(f"Unknown resource URI: {uri}")
             
     except Exception as e:
-        logger.error(f"Error getting resource {uri}: {e}")
+        logger.error("Error getting resource %s: %s", uri, e)
         raise
 
 
@@ -624,5 +749,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
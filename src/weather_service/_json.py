@@ -0,0 +1,42 @@
+"""
+JSON helpers for the weather service.
+
+Uses orjson when it is installed and falls back to the standard library
+json module otherwise.
+"""
+
+import json
+from datetime import date
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _default(obj):
+    """Encode dates and datetimes as ISO 8601 strings, as orjson does"""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, optionally indented by two spaces
+
+    date and datetime values are written as ISO 8601 strings. Values orjson
+    rejects (such as integers beyond 64 bits) fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None, default=_default)
+
+
+def loads(data):
+    """Parse JSON from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)